@@ -1,31 +1,110 @@
 import pandas as pd
 import numpy as np
+import os
+import pyarrow as pa
+import polars as pl
 import matplotlib.pyplot as plt
 import seaborn as sns
 import warnings
+from functools import cached_property
+from pathlib import Path
 warnings.filterwarnings('ignore')
 
+# Column types declared up front so the pyarrow reader skips inference;
+# date_added stays a string and is parsed in preprocess_data, and type and
+# rating stay strings until preprocess_data makes them categoricals
+CSV_SCHEMA = {
+    'release_year': pd.ArrowDtype(pa.int32()),
+}
+
+# Month names as written in date_added ("September 25, 2021")
+MONTHS = {
+    'January': 1, 'February': 2, 'March': 3, 'April': 4, 'May': 5, 'June': 6,
+    'July': 7, 'August': 8, 'September': 9, 'October': 10, 'November': 11, 'December': 12,
+}
+
+# Version of the Parquet cache written by preprocess_data; bump it whenever
+# preprocessing changes so caches written by older code are not reused
+CACHE_VERSION = 1
+
+# Columns added by preprocess_data, all of which a usable cache must have
+DERIVED_COLUMNS = ['year_added', 'month_added', 'day_added', 'duration_min', 'seasons', 'content_type']
+
+# Descriptions tokenized per pass by keyword_analysis, bounding peak memory
+KEYWORD_CHUNK_SIZE = 10000
+
+# Panels drawn by each visualize_* method, in their default layout order
+CONTENT_TYPE_PANELS = ('type_pie', 'type_by_year', 'type_vs_rating', 'type_by_country')
+TREND_PANELS = ('added_over_time', 'release_years', 'rating_trends', 'genre_trends')
+DURATION_PANELS = ('movie_durations', 'tv_seasons', 'duration_comparison', 'duration_by_rating')
+GENRE_PANELS = ('top_genres', 'genre_by_type', 'genre_pairs', 'genre_trends')
+
+# Per-description word lists produced by keyword_analysis
+WORD_LIST_DTYPE = pd.ArrowDtype(pa.list_(pa.string()))
+
+# Common words skipped by keyword_analysis
+STOP_WORDS = frozenset({'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should', 'may', 'might', 'must', 'can', 'this', 'that', 'these', 'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they', 'them', 'their', 'what', 'which', 'who', 'when', 'where', 'why', 'how', 'all', 'any', 'both', 'each', 'few', 'more', 'most', 'other', 'some', 'such', 'no', 'nor', 'not', 'only', 'own', 'same', 'so', 'than', 'too', 'very', 'just', 'now'})
+
 class NetflixAnalyzer:
     def __init__(self, data_path='netflix_data.csv'):
         """
         Initialize the Netflix Analyzer with data loading and preprocessing
         """
         self.df = None
+        self._pl = None
+        self._cache_path = None
+        self._from_cache = False
         self.load_data(data_path)
         self.preprocess_data()
         
     def load_data(self, data_path):
         """
-        Load Netflix data from CSV file
+        Load Netflix data from CSV file, or from its preprocessed Parquet
+        cache when that is newer than the CSV
         """
+        self._cache_path = Path(data_path).with_suffix(f'.preprocessed-v{CACHE_VERSION}.parquet')
         try:
-            self.df = pd.read_csv(data_path)
+            if (self._cache_path.exists()
+                    and self._cache_path.stat().st_mtime > Path(data_path).stat().st_mtime):
+                try:
+                    self.df = self._read_cache()
+                except Exception as e:
+                    print(f"Ignoring unusable cache {self._cache_path}: {e}")
+                else:
+                    self._from_cache = True
+                    print(f"Successfully loaded {len(self.df)} Netflix titles from {self._cache_path}")
+                    return
+            self.df = pd.read_csv(data_path, engine='pyarrow',
+                                  dtype_backend='pyarrow', dtype=CSV_SCHEMA)
             print(f"Successfully loaded {len(self.df)} Netflix titles")
         except FileNotFoundError:
             print(f"Data file {data_path} not found. Please check the file path.")
         except Exception as e:
             print(f"Error loading data: {e}")
     
+    def _read_cache(self):
+        """
+        Read the Parquet cache with the same dtypes as a fresh CSV load,
+        refusing one written by another cache version or by other code
+        """
+        df = pd.read_parquet(self._cache_path)
+        version = df.attrs.get('cache_version')
+        if version != CACHE_VERSION:
+            raise ValueError(f"cache version {version}, expected {CACHE_VERSION}")
+        missing = [col for col in DERIVED_COLUMNS if col not in df.columns]
+        if missing:
+            raise ValueError(f"missing columns {missing}")
+        
+        # Arrow strings come back as pandas' own string dtype, both as columns
+        # and as the categories of the categoricals cast from CSV columns
+        for col, dtype in df.dtypes.items():
+            if isinstance(dtype, pd.StringDtype) and dtype.na_value is pd.NA:
+                df[col] = df[col].astype(pd.ArrowDtype(pa.string()))
+        for col in ['type', 'rating']:
+            categories = df[col].cat.categories.astype(pd.ArrowDtype(pa.string()))
+            df[col] = df[col].cat.rename_categories(categories)
+        return df
+    
     def preprocess_data(self):
         """
         Preprocess and clean the data
@@ -33,10 +112,20 @@ class NetflixAnalyzer:
         if self.df is None:
             print("No data to preprocess")
             return
+        
+        # A frame read from the Parquet cache was cleaned before it was saved
+        if self._from_cache:
+            self._pl = pl.from_pandas(self.df)
+            print("Data preprocessing completed")
+            return
             
-        # Convert date_added to datetime
-        self.df['date_added'] = pd.to_datetime(self.df['date_added'], 
-                                               format='%B %d, %Y', 
+        # Convert date_added to datetime by splitting it into numeric parts
+        parts = self.df['date_added'].str.strip().str.extract(
+            r'^(?P<month>[A-Za-z]+) (?P<day>\d{1,2}), (?P<year>\d{4})$'
+        )
+        # Month names match in any case, as they did with format='%B'
+        parts['month'] = parts['month'].str.capitalize().map(MONTHS)
+        self.df['date_added'] = pd.to_datetime(parts[['year', 'month', 'day']].astype('float64'),
                                                errors='coerce')
         
         # Extract year, month, day from date_added
@@ -45,22 +134,120 @@ class NetflixAnalyzer:
         self.df['day_added'] = self.df['date_added'].dt.day_name()
         
         # Clean duration column for movies (convert to minutes)
-        self.df['duration_min'] = self.df['duration'].apply(
-            lambda x: int(x.split(' ')[0]) if 'min' in str(x) else np.nan
-        )
-        
+        self.df['duration_min'] = self.df['duration'].str.extract(
+            r'^(?P<minutes>\d+)\s*min', expand=False
+        ).astype('float64')
+
         # Clean duration for TV shows (convert to seasons)
-        self.df['seasons'] = self.df['duration'].apply(
-            lambda x: int(x.split(' ')[0]) if 'Season' in str(x) else np.nan
-        )
-        
+        self.df['seasons'] = self.df['duration'].str.extract(
+            r'^(?P<seasons>\d+)\s*Season', expand=False
+        ).astype('float64')
+
         # Create content type column
-        self.df['content_type'] = self.df['type'].apply(
-            lambda x: 'Movie' if x == 'Movie' else 'TV Show'
+        self.df['content_type'] = np.where(
+            (self.df['type'] == 'Movie').fillna(False).to_numpy(dtype=bool), 'Movie', 'TV Show'
         )
-        
+
+        # Low-cardinality labels as categoricals so groupbys work on int codes
+        for col in ['type', 'rating', 'content_type']:
+            self.df[col] = self.df[col].astype('category')
+
+        # Cache the cleaned frame so the next run can skip preprocessing. The
+        # version is kept in the frame's attrs, which Parquet stores; the file
+        # is written under a temporary name first so an interrupted write
+        # never leaves a truncated cache behind
+        self.df.attrs['cache_version'] = CACHE_VERSION
+        tmp_path = self._cache_path.with_suffix('.tmp.parquet')
+        try:
+            self.df.to_parquet(tmp_path, compression='zstd')
+            os.replace(tmp_path, self._cache_path)
+        except Exception as e:
+            tmp_path.unlink(missing_ok=True)
+            print(f"Could not write cache {self._cache_path}: {e}")
+
+        # Polars view of the cleaned frame, used for the heavy aggregations
+        self._pl = pl.from_pandas(self.df)
+
         print("Data preprocessing completed")
-        
+
+    def _pl_value_counts(self, expr):
+        """
+        Count the values of a Polars expression, returned as a pandas Series
+        """
+        name = expr.meta.output_name()
+        counts = (
+            self._pl.lazy()
+            .select(expr)
+            .drop_nulls()
+            .group_by(name, maintain_order=True)
+            .agg(pl.len().cast(pl.Int64).alias('count'))
+            .sort('count', descending=True, maintain_order=True)
+            .collect()
+        )
+        return counts.to_pandas().set_index(name)['count']
+
+    def _pl_crosstab(self, index, columns):
+        """
+        Count rows per (index, columns) pair through Polars, returned as a
+        pandas frame shaped like groupby(...).size().unstack(fill_value=0)
+        """
+        counts = (
+            self._pl.lazy()
+            .drop_nulls([index, columns])
+            .group_by([index, columns])
+            .agg(pl.len().cast(pl.Int64).alias('count'))
+            .collect()
+            .pivot(on=columns, index=index, values='count', sort_columns=True)
+            .sort(index)
+            .fill_null(0)
+        )
+        table = counts.to_pandas().set_index(index)
+        table.columns.name = columns
+        return table
+
+    @cached_property
+    def _content_by_year(self):
+        """
+        Titles per release year and content type
+        """
+        return self._pl_crosstab('release_year', 'content_type')
+
+    @cached_property
+    def _country_content(self):
+        """
+        Titles per country and content type
+        """
+        return self._pl_crosstab('country', 'content_type')
+
+    @cached_property
+    def _rating_by_year(self):
+        """
+        Titles per release year and rating
+        """
+        return self._pl_crosstab('release_year', 'rating')
+
+    @cached_property
+    def _exploded_genres(self):
+        """
+        One genre per row, keeping the index of the title it came from
+        """
+        return self.df['listed_in'].str.split(', ', regex=False).explode()
+
+    @cached_property
+    def _genre_counts(self):
+        """
+        Number of titles per genre, most common first
+        """
+        return self._exploded_genres.value_counts()
+
+    @cached_property
+    def _genre_by_year(self):
+        """
+        Number of titles per genre for each release year, one column per genre
+        """
+        exploded = self._exploded_genres.rename('genre').to_frame().join(self.df[['release_year']])
+        return exploded.groupby(['release_year', 'genre']).size().unstack(fill_value=0)
+
     def content_type_analysis(self):
         """
         Analyze content types (Movies vs TV Shows)
@@ -74,7 +261,7 @@ class NetflixAnalyzer:
         """
         Analyze content by country
         """
-        country_counts = self.df['country'].value_counts()
+        country_counts = self._pl_value_counts(pl.col('country'))
         print("\nTop Countries by Content Count:")
         print(country_counts.head(10))
         return country_counts
@@ -101,9 +288,7 @@ class NetflixAnalyzer:
         """
         Analyze content by genre
         """
-        # Split genres and count occurrences
-        all_genres = self.df['listed_in'].str.split(', ').explode()
-        genre_counts = all_genres.value_counts()
+        genre_counts = self._genre_counts.copy()
         print("\nTop Genres:")
         print(genre_counts.head(10))
         return genre_counts
@@ -131,17 +316,17 @@ class NetflixAnalyzer:
         print("\n=== Advanced Content Analysis ===")
         
         # Content type distribution over years
-        content_by_year = self.df.groupby(['release_year', 'content_type']).size().unstack(fill_value=0)
+        content_by_year = self._content_by_year.copy()
         print("\nContent Type Distribution by Release Year:")
         print(content_by_year.tail(5))
         
         # Country-content type analysis
-        country_content = self.df.groupby(['country', 'content_type']).size().unstack(fill_value=0)
+        country_content = self._country_content.copy()
         print("\nContent Type Distribution by Country (Top 5):")
         print(country_content.head(5))
         
         # Rating trends over time
-        rating_by_year = self.df.groupby(['release_year', 'rating']).size().unstack(fill_value=0)
+        rating_by_year = self._rating_by_year.copy()
         print("\nRating Trends by Year:")
         print(rating_by_year.tail(5))
         
@@ -162,7 +347,7 @@ class NetflixAnalyzer:
         
         # Directors by content type
         if 'director' in self.df.columns:
-            director_type = self.df.groupby(['director', 'content_type']).size().unstack(fill_value=0)
+            director_type = self.df.groupby(['director', 'content_type'], observed=True).size().unstack(fill_value=0)
             print("\nDirectors by Content Type (Top 5):")
             print(director_type.head(5))
             
@@ -209,244 +394,291 @@ class NetflixAnalyzer:
         """
         print("\n=== Keyword Analysis ===")
         
-        # Convert descriptions to lowercase and split into words
-        all_descriptions = ' '.join(self.df['description'].fillna('').str.lower())
-        words = all_descriptions.split()
-        
-        # Remove common stop words
-        stop_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should', 'may', 'might', 'must', 'can', 'this', 'that', 'these', 'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they', 'them', 'their', 'what', 'which', 'who', 'when', 'where', 'why', 'how', 'all', 'any', 'both', 'each', 'few', 'more', 'most', 'other', 'some', 'such', 'no', 'nor', 'not', 'only', 'own', 'same', 'so', 'than', 'too', 'very', 'just', 'now'}
-        filtered_words = [word for word in words if word not in stop_words and len(word) > 3]
+        # Work through the descriptions in chunks so only one chunk's words
+        # are held in memory at a time
+        descriptions = self.df['description']
+        word_counts = pd.Series(dtype='int64')
+        for start in range(0, len(descriptions), KEYWORD_CHUNK_SIZE):
+            chunk = descriptions.iloc[start:start + KEYWORD_CHUNK_SIZE]
+            
+            # Convert descriptions to lowercase and pull out words of 4+ letters,
+            # accented ones included; the cast keeps a chunk without any such
+            # word from being typed list<null>, which explode cannot handle
+            words = (chunk.fillna('').str.lower().str.findall(r'[^\W\d_]{4,}')
+                     .astype(WORD_LIST_DTYPE).explode().dropna())
+            
+            # Remove common stop words, then count word frequencies as a
+            # bincount over integer word codes
+            words = words[~words.isin(STOP_WORDS)]
+            codes, uniques = pd.factorize(words)
+            chunk_counts = pd.Series(np.bincount(codes, minlength=len(uniques)), index=uniques)
+            word_counts = word_counts.add(chunk_counts, fill_value=0)
         
-        # Count word frequencies
-        from collections import Counter
-        word_counts = Counter(filtered_words)
+        word_counts = word_counts.astype('int64').sort_values(ascending=False, kind='stable')
         
         print("\nTop Keywords in Descriptions:")
-        for word, count in word_counts.most_common(10):
+        for word, count in word_counts.head(10).items():
             print(f"{word}: {count}")
         
         return word_counts
     
-    def visualize_content_types(self):
+    def _plot_panels(self, title, panels, available, filename, save):
         """
-        Create unique visualizations for content types
+        Draw the requested panels on one figure; the PNG is written at print
+        resolution only when save is set
         """
+        if isinstance(panels, str):
+            panels = (panels,)
+        if not panels:
+            raise ValueError(f"No panels selected; choose from {list(available)}")
+        unknown = [panel for panel in panels if panel not in available]
+        if unknown:
+            raise ValueError(f"Unknown panels {unknown}; choose from {list(available)}")
+        
         # Set up the plotting style
         plt.style.use('seaborn-v0_8-darkgrid')
-        fig, axes = plt.subplots(2, 2, figsize=(15, 12))
-        fig.suptitle('Netflix Content Analysis - Content Types', fontsize=16, fontweight='bold')
+        ncols = 1 if len(panels) == 1 else 2
+        nrows = -(-len(panels) // ncols)
+        fig, axes = plt.subplots(nrows, ncols, figsize=(7.5 * ncols, 6 * nrows), squeeze=False)
+        fig.suptitle(title, fontsize=16, fontweight='bold')
         
-        # 1. Content Type Distribution Pie Chart
-        content_counts = self.df['content_type'].value_counts()
-        axes[0, 0].pie(content_counts.values, labels=content_counts.index, autopct='%1.1f%%', startangle=90)
-        axes[0, 0].set_title('Content Type Distribution')
-        
-        # 2. Content Type by Year Stacked Bar Chart
-        content_by_year = self.df.groupby(['release_year', 'content_type']).size().unstack(fill_value=0)
-        content_by_year.plot(kind='bar', stacked=True, ax=axes[0, 1])
-        axes[0, 1].set_title('Content Type Distribution by Year')
-        axes[0, 1].set_xlabel('Release Year')
-        axes[0, 1].set_ylabel('Number of Titles')
-        axes[0, 1].legend(title='Content Type')
-        axes[0, 1].tick_params(axis='x', rotation=45)
-        
-        # 3. Content Type by Rating Heatmap
-        content_rating = self.df.groupby(['content_type', 'rating']).size().unstack(fill_value=0)
-        sns.heatmap(content_rating, annot=True, fmt='d', cmap='Blues', ax=axes[1, 0])
-        axes[1, 0].set_title('Content Type vs Rating')
-        axes[1, 0].set_xlabel('Rating')
-        axes[1, 0].set_ylabel('Content Type')
-        
-        # 4. Content Type by Country (Top 10)
-        country_content = self.df.groupby(['country', 'content_type']).size().unstack(fill_value=0)
-        top_countries = country_content.sum(axis=1).nlargest(10).index
-        country_content.loc[top_countries].plot(kind='bar', stacked=True, ax=axes[1, 1])
-        axes[1, 1].set_title('Content Type Distribution by Country (Top 10)')
-        axes[1, 1].set_xlabel('Country')
-        axes[1, 1].set_ylabel('Number of Titles')
-        axes[1, 1].legend(title='Content Type')
-        axes[1, 1].tick_params(axis='x', rotation=45)
+        for ax, panel in zip(axes.flat, panels):
+            getattr(self, f'_panel_{panel}')(ax)
+        for ax in axes.flat[len(panels):]:
+            ax.set_visible(False)
         
         plt.tight_layout()
-        plt.savefig('netflix_content_types.png', dpi=300, bbox_inches='tight')
+        if save:
+            plt.savefig(filename, dpi=300, bbox_inches='tight')
         plt.show()
     
-    def visualize_trends(self):
+    def visualize_content_types(self, panels=CONTENT_TYPE_PANELS, save=False):
+        """
+        Create unique visualizations for content types
+        """
+        self._plot_panels('Netflix Content Analysis - Content Types', panels,
+                          CONTENT_TYPE_PANELS, 'netflix_content_types.png', save)
+    
+    def _panel_type_pie(self, ax):
+        """
+        Content Type Distribution Pie Chart
+        """
+        content_counts = self.df['content_type'].value_counts()
+        ax.pie(content_counts.values, labels=content_counts.index, autopct='%1.1f%%', startangle=90)
+        ax.set_title('Content Type Distribution')
+    
+    def _panel_type_by_year(self, ax):
+        """
+        Content Type by Year Stacked Bar Chart
+        """
+        self._content_by_year.plot(kind='bar', stacked=True, ax=ax)
+        ax.set_title('Content Type Distribution by Year')
+        ax.set_xlabel('Release Year')
+        ax.set_ylabel('Number of Titles')
+        ax.legend(title='Content Type')
+        ax.tick_params(axis='x', rotation=45)
+    
+    def _panel_type_vs_rating(self, ax):
+        """
+        Content Type by Rating Heatmap
+        """
+        content_rating = self.df.groupby(['content_type', 'rating'], observed=True).size().unstack(fill_value=0)
+        sns.heatmap(content_rating, annot=True, fmt='d', cmap='Blues', ax=ax)
+        ax.set_title('Content Type vs Rating')
+        ax.set_xlabel('Rating')
+        ax.set_ylabel('Content Type')
+    
+    def _panel_type_by_country(self, ax):
+        """
+        Content Type by Country (Top 10)
+        """
+        country_content = self._country_content
+        top_countries = country_content.sum(axis=1).nlargest(10).index
+        country_content.loc[top_countries].plot(kind='bar', stacked=True, ax=ax)
+        ax.set_title('Content Type Distribution by Country (Top 10)')
+        ax.set_xlabel('Country')
+        ax.set_ylabel('Number of Titles')
+        ax.legend(title='Content Type')
+        ax.tick_params(axis='x', rotation=45)
+    
+    def visualize_trends(self, panels=TREND_PANELS, save=False):
         """
         Create unique visualizations for trends over time
         """
-        # Set up the plotting style
-        plt.style.use('seaborn-v0_8-darkgrid')
-        fig, axes = plt.subplots(2, 2, figsize=(15, 12))
-        fig.suptitle('Netflix Content Analysis - Trends Over Time', fontsize=16, fontweight='bold')
-        
-        # 1. Content Added Over Time Line Chart
+        self._plot_panels('Netflix Content Analysis - Trends Over Time', panels,
+                          TREND_PANELS, 'netflix_trends.png', save)
+    
+    def _panel_added_over_time(self, ax):
+        """
+        Content Added Over Time Line Chart
+        """
         if 'year_added' in self.df.columns:
             yearly_added = self.df['year_added'].value_counts().sort_index()
-            axes[0, 0].plot(yearly_added.index, yearly_added.values, marker='o', linewidth=2, markersize=8)
-            axes[0, 0].set_title('Content Added Over Time')
-            axes[0, 0].set_xlabel('Year Added')
-            axes[0, 0].set_ylabel('Number of Titles')
-            axes[0, 0].grid(True)
-        
-        # 2. Release Year Distribution Histogram
-        axes[0, 1].hist(self.df['release_year'], bins=20, color='skyblue', edgecolor='black')
-        axes[0, 1].set_title('Distribution of Release Years')
-        axes[0, 1].set_xlabel('Release Year')
-        axes[0, 1].set_ylabel('Frequency')
-        
-        # 3. Rating Trends Over Time
-        rating_by_year = self.df.groupby(['release_year', 'rating']).size().unstack(fill_value=0)
-        rating_by_year.plot(kind='area', stacked=True, ax=axes[1, 0], alpha=0.7)
-        axes[1, 0].set_title('Rating Trends Over Time')
-        axes[1, 0].set_xlabel('Release Year')
-        axes[1, 0].set_ylabel('Number of Titles')
-        axes[1, 0].legend(title='Rating', bbox_to_anchor=(1.05, 1), loc='upper left')
-        
-        # 4. Genre Popularity Over Time (Top 5 Genres)
-        all_genres = self.df['listed_in'].str.split(', ').explode()
-        top_genres = all_genres.value_counts().head(5).index
-        
-        genre_year_data = []
-        for genre in top_genres:
-            genre_mask = self.df['listed_in'].str.contains(genre, na=False)
-            genre_by_year = self.df[genre_mask].groupby('release_year').size()
-            genre_year_data.append((genre, genre_by_year))
-        
-        for genre, data in genre_year_data:
-            axes[1, 1].plot(data.index, data.values, marker='o', label=genre, linewidth=2)
-        axes[1, 1].set_title('Top 5 Genre Popularity Over Time')
-        axes[1, 1].set_xlabel('Release Year')
-        axes[1, 1].set_ylabel('Number of Titles')
-        axes[1, 1].legend()
-        axes[1, 1].grid(True)
+            ax.plot(yearly_added.index, yearly_added.values, marker='o', linewidth=2, markersize=8)
+            ax.set_title('Content Added Over Time')
+            ax.set_xlabel('Year Added')
+            ax.set_ylabel('Number of Titles')
+            ax.grid(True)
+    
+    def _panel_release_years(self, ax):
+        """
+        Release Year Distribution Histogram
+        """
+        ax.hist(self.df['release_year'], bins=20, color='skyblue', edgecolor='black')
+        ax.set_title('Distribution of Release Years')
+        ax.set_xlabel('Release Year')
+        ax.set_ylabel('Frequency')
+    
+    def _panel_rating_trends(self, ax):
+        """
+        Rating Trends Over Time
+        """
+        self._rating_by_year.plot(kind='area', stacked=True, ax=ax, alpha=0.7)
+        ax.set_title('Rating Trends Over Time')
+        ax.set_xlabel('Release Year')
+        ax.set_ylabel('Number of Titles')
+        ax.legend(title='Rating', bbox_to_anchor=(1.05, 1), loc='upper left')
+    
+    def _panel_genre_trends(self, ax):
+        """
+        Genre Popularity Over Time (Top 5 Genres)
+        """
+        top_genres = self._genre_counts.head(5).index
+        genre_by_year = self._genre_by_year
         
-        plt.tight_layout()
-        plt.savefig('netflix_trends.png', dpi=300, bbox_inches='tight')
-        plt.show()
+        for genre in top_genres:
+            data = genre_by_year[genre]
+            ax.plot(data.index, data.values, marker='o', label=genre, linewidth=2)
+        ax.set_title('Top 5 Genre Popularity Over Time')
+        ax.set_xlabel('Release Year')
+        ax.set_ylabel('Number of Titles')
+        ax.legend()
+        ax.grid(True)
     
-    def visualize_duration(self):
+    def visualize_duration(self, panels=DURATION_PANELS, save=False):
         """
         Create unique visualizations for content duration
         """
-        # Filter data for movies and TV shows with valid duration
-        movies = self.df[(self.df['content_type'] == 'Movie') & (self.df['duration_min'].notnull())]
-        tv_shows = self.df[(self.df['content_type'] == 'TV Show') & (self.df['seasons'].notnull())]
-        
-        # Set up the plotting style
-        plt.style.use('seaborn-v0_8-darkgrid')
-        fig, axes = plt.subplots(2, 2, figsize=(15, 12))
-        fig.suptitle('Netflix Content Analysis - Duration Insights', fontsize=16, fontweight='bold')
-        
-        # 1. Movie Duration Distribution
-        if not movies.empty:
-            axes[0, 0].hist(movies['duration_min'], bins=20, color='lightcoral', edgecolor='black')
-            axes[0, 0].set_title('Movie Duration Distribution')
-            axes[0, 0].set_xlabel('Duration (minutes)')
-            axes[0, 0].set_ylabel('Frequency')
-            axes[0, 0].axvline(movies['duration_min'].mean(), color='red', linestyle='--',
-                              label=f'Mean: {movies["duration_min"].mean():.1f} min')
-            axes[0, 0].legend()
-        
-        # 2. TV Show Seasons Distribution
-        if not tv_shows.empty:
-            axes[0, 1].hist(tv_shows['seasons'], bins=10, color='lightblue', edgecolor='black')
-            axes[0, 1].set_title('TV Show Seasons Distribution')
-            axes[0, 1].set_xlabel('Number of Seasons')
-            axes[0, 1].set_ylabel('Frequency')
-            axes[0, 1].axvline(tv_shows['seasons'].mean(), color='blue', linestyle='--',
-                              label=f'Mean: {tv_shows["seasons"].mean():.1f} seasons')
-            axes[0, 1].legend()
-        
-        # 3. Duration by Content Type Box Plot
-        duration_data = [movies['duration_min'].dropna(), tv_shows['seasons'].dropna()]
-        axes[1, 0].boxplot(duration_data, labels=['Movies (min)', 'TV Shows (seasons)'])
-        axes[1, 0].set_title('Duration Comparison: Movies vs TV Shows')
-        axes[1, 0].set_ylabel('Duration')
-        
-        # 4. Duration by Rating (Movies only)
+        self._plot_panels('Netflix Content Analysis - Duration Insights', panels,
+                          DURATION_PANELS, 'netflix_duration.png', save)
+    
+    @cached_property
+    def _movies_with_duration(self):
+        """
+        Movies with a valid duration in minutes
+        """
+        return self.df[(self.df['content_type'] == 'Movie') & (self.df['duration_min'].notnull())]
+    
+    @cached_property
+    def _tv_shows_with_seasons(self):
+        """
+        TV shows with a valid number of seasons
+        """
+        return self.df[(self.df['content_type'] == 'TV Show') & (self.df['seasons'].notnull())]
+    
+    def _panel_movie_durations(self, ax):
+        """
+        Movie Duration Distribution
+        """
+        movie_minutes = self._movies_with_duration['duration_min'].to_numpy()
+        if movie_minutes.size:
+            ax.hist(movie_minutes, bins=20, color='lightcoral', edgecolor='black')
+            ax.set_title('Movie Duration Distribution')
+            ax.set_xlabel('Duration (minutes)')
+            ax.set_ylabel('Frequency')
+            ax.axvline(movie_minutes.mean(), color='red', linestyle='--',
+                       label=f'Mean: {movie_minutes.mean():.1f} min')
+            ax.legend()
+    
+    def _panel_tv_seasons(self, ax):
+        """
+        TV Show Seasons Distribution
+        """
+        tv_seasons = self._tv_shows_with_seasons['seasons'].to_numpy()
+        if tv_seasons.size:
+            ax.hist(tv_seasons, bins=10, color='lightblue', edgecolor='black')
+            ax.set_title('TV Show Seasons Distribution')
+            ax.set_xlabel('Number of Seasons')
+            ax.set_ylabel('Frequency')
+            ax.axvline(tv_seasons.mean(), color='blue', linestyle='--',
+                       label=f'Mean: {tv_seasons.mean():.1f} seasons')
+            ax.legend()
+    
+    def _panel_duration_comparison(self, ax):
+        """
+        Duration by Content Type Box Plot
+        """
+        duration_data = [self._movies_with_duration['duration_min'].to_numpy(),
+                         self._tv_shows_with_seasons['seasons'].to_numpy()]
+        ax.boxplot(duration_data, labels=['Movies (min)', 'TV Shows (seasons)'])
+        ax.set_title('Duration Comparison: Movies vs TV Shows')
+        ax.set_ylabel('Duration')
+    
+    def _panel_duration_by_rating(self, ax):
+        """
+        Duration by Rating (Movies only)
+        """
+        movies = self._movies_with_duration
         if not movies.empty:
-            rating_duration = movies.groupby('rating')['duration_min'].mean().sort_values(ascending=False)
-            axes[1, 1].bar(rating_duration.index, rating_duration.values, color='orange')
-            axes[1, 1].set_title('Average Movie Duration by Rating')
-            axes[1, 1].set_xlabel('Rating')
-            axes[1, 1].set_ylabel('Average Duration (minutes)')
-            axes[1, 1].tick_params(axis='x', rotation=45)
-        
-        plt.tight_layout()
-        plt.savefig('netflix_duration.png', dpi=300, bbox_inches='tight')
-        plt.show()
+            rating_duration = movies.groupby('rating', observed=True, sort=False)['duration_min'].mean().sort_values(ascending=False)
+            ax.bar(rating_duration.index, rating_duration.values, color='orange')
+            ax.set_title('Average Movie Duration by Rating')
+            ax.set_xlabel('Rating')
+            ax.set_ylabel('Average Duration (minutes)')
+            ax.tick_params(axis='x', rotation=45)
     
-    def visualize_genres(self):
+    def visualize_genres(self, panels=GENRE_PANELS, save=False):
         """
         Create unique visualizations for genre analysis
         """
-        # Split genres and count occurrences
-        all_genres = self.df['listed_in'].str.split(', ').explode()
-        genre_counts = all_genres.value_counts().head(15)
-        
-        # Set up the plotting style
-        plt.style.use('seaborn-v0_8-darkgrid')
-        fig, axes = plt.subplots(2, 2, figsize=(15, 12))
-        fig.suptitle('Netflix Content Analysis - Genre Insights', fontsize=16, fontweight='bold')
-        
-        # 1. Top Genres Bar Chart
-        axes[0, 0].barh(genre_counts.index, genre_counts.values, color='purple')
-        axes[0, 0].set_title('Top 15 Genres')
-        axes[0, 0].set_xlabel('Number of Titles')
-        
-        # 2. Genre Distribution by Content Type
-        genre_content = self.df.groupby(['listed_in', 'content_type']).size().unstack(fill_value=0)
+        self._plot_panels('Netflix Content Analysis - Genre Insights', panels,
+                          GENRE_PANELS, 'netflix_genres.png', save)
+    
+    def _panel_top_genres(self, ax):
+        """
+        Top Genres Bar Chart
+        """
+        genre_counts = self._genre_counts.head(15)
+        ax.barh(genre_counts.index, genre_counts.values, color='purple')
+        ax.set_title('Top 15 Genres')
+        ax.set_xlabel('Number of Titles')
+    
+    def _panel_genre_by_type(self, ax):
+        """
+        Genre Distribution by Content Type
+        """
+        genre_content = self.df.groupby(['listed_in', 'content_type'], observed=True).size().unstack(fill_value=0)
         # Get top 10 genres by total count
-        top_genres = all_genres.value_counts().head(10).index
+        top_genres = self._genre_counts.head(10).index
         genre_content_top = genre_content.loc[genre_content.index.isin(top_genres)]
-        genre_content_top.plot(kind='bar', stacked=True, ax=axes[0, 1])
-        axes[0, 1].set_title('Genre Distribution by Content Type (Top 10)')
-        axes[0, 1].set_xlabel('Genre')
-        axes[0, 1].set_ylabel('Number of Titles')
-        axes[0, 1].legend(title='Content Type')
-        axes[0, 1].tick_params(axis='x', rotation=45)
-        
-        # 3. Genre Network Graph (simplified)
+        genre_content_top.plot(kind='bar', stacked=True, ax=ax)
+        ax.set_title('Genre Distribution by Content Type (Top 10)')
+        ax.set_xlabel('Genre')
+        ax.set_ylabel('Number of Titles')
+        ax.legend(title='Content Type')
+        ax.tick_params(axis='x', rotation=45)
+    
+    def _panel_genre_pairs(self, ax):
+        """
+        Genre Network Graph (simplified)
+        """
         # For visualization purposes, we'll create a simple network of top genres
-        from collections import Counter
-        genre_pairs = []
-        for genres in self.df['listed_in'].str.split(', '):
-            if isinstance(genres, list) and len(genres) > 1:
-                for i in range(len(genres)):
-                    for j in range(i+1, len(genres)):
-                        genre_pairs.append((genres[i].strip(), genres[j].strip()))
+        # Pair up genres of the same title by self-joining on the title's row
+        genres = self._exploded_genres.dropna().astype('category')
+        rows = pd.DataFrame({'row': genres.index, 'genre': genres.cat.codes.to_numpy()})
+        pairs = rows.merge(rows, on='row')
+        pairs = pairs[pairs['genre_x'] < pairs['genre_y']]
         
         # Count co-occurrences
-        pair_counts = Counter(genre_pairs)
-        top_pairs = pair_counts.most_common(10)
+        top_pairs = pairs.groupby(['genre_x', 'genre_y'], sort=False).size().nlargest(10)
         
         # Create a simple bar chart of genre co-occurrences
-        if top_pairs:
-            pairs, counts = zip(*top_pairs)
-            pair_labels = [f"{p[0]} & {p[1]}" for p in pairs]
-            axes[1, 0].barh(pair_labels, counts, color='green')
-            axes[1, 0].set_title('Top Genre Combinations')
-            axes[1, 0].set_xlabel('Co-occurrence Count')
-        
-        # 4. Genre Popularity Over Time
-        # Get top 5 genres
-        top_5_genres = all_genres.value_counts().head(5).index
-        
-        for genre in top_5_genres:
-            genre_mask = self.df['listed_in'].str.contains(genre, na=False)
-            genre_by_year = self.df[genre_mask].groupby('release_year').size()
-            axes[1, 1].plot(genre_by_year.index, genre_by_year.values, marker='o', label=genre, linewidth=2)
-        
-        axes[1, 1].set_title('Top 5 Genre Popularity Over Time')
-        axes[1, 1].set_xlabel('Release Year')
-        axes[1, 1].set_ylabel('Number of Titles')
-        axes[1, 1].legend()
-        axes[1, 1].grid(True)
-        
-        plt.tight_layout()
-        plt.savefig('netflix_genres.png', dpi=300, bbox_inches='tight')
-        plt.show()
+        if not top_pairs.empty:
+            names = genres.cat.categories
+            pair_labels = [f"{names[a]} & {names[b]}" for a, b in top_pairs.index]
+            ax.barh(pair_labels, top_pairs.values, color='green')
+            ax.set_title('Top Genre Combinations')
+            ax.set_xlabel('Co-occurrence Count')
     
     def interactive_dashboard(self):
         """
@@ -469,16 +701,16 @@ class NetflixAnalyzer:
                 
                 if choice == '1':
                     self.content_type_analysis()
-                    self.visualize_content_types()
+                    self.visualize_content_types(panels=('type_pie', 'type_by_year'))
                 elif choice == '2':
                     self.genre_analysis()
-                    self.visualize_genres()
+                    self.visualize_genres(panels=('top_genres',))
                 elif choice == '3':
                     self.rating_analysis()
-                    self.visualize_trends()
+                    self.visualize_trends(panels=('rating_trends',))
                 elif choice == '4':
                     self.duration_analysis()
-                    self.visualize_duration()
+                    self.visualize_duration(panels=('movie_durations', 'tv_seasons'))
                 elif choice == '5':
                     self.search_content()
                 elif choice == '6':
@@ -518,26 +750,28 @@ class NetflixAnalyzer:
             print("Invalid choice. Showing both types.")
         
         # Get genre preference
-        all_genres = self.df['listed_in'].str.split(', ').explode().unique()
-        print(f"\nAvailable genres: {', '.join(all_genres[:10])}...")
+        top_genres = self._genre_counts.index[:10].tolist()
+        print(f"\nAvailable genres: {', '.join(top_genres)}...")
         genre = input("Enter a genre you're interested in (or press Enter to skip): ").strip()
         
         # Get rating preference
-        ratings = self.df['rating'].unique()
+        ratings = self.df['rating'].cat.categories.tolist()
         print(f"\nAvailable ratings: {', '.join(ratings)}")
         rating = input("Enter a rating you prefer (or press Enter to skip): ").strip()
         
-        # Filter content based on preferences
-        filtered_df = self.df.copy()
+        # Filter content based on preferences, slicing the frame only once
+        mask = np.ones(len(self.df), dtype=bool)
         
         if content_type:
-            filtered_df = filtered_df[filtered_df['content_type'] == content_type]
+            mask &= (self.df['content_type'] == content_type).to_numpy()
         
         if genre:
-            filtered_df = filtered_df[filtered_df['listed_in'].str.contains(genre, case=False, na=False)]
+            mask &= self.df['listed_in'].str.contains(genre, case=False, na=False, regex=False).to_numpy()
         
         if rating:
-            filtered_df = filtered_df[filtered_df['rating'] == rating.upper()]
+            mask &= (self.df['rating'] == rating.upper()).to_numpy()
+        
+        filtered_df = self.df[mask]
         
         # Show recommendations
         if not filtered_df.empty:
@@ -563,14 +797,16 @@ class NetflixAnalyzer:
             print("No search query provided.")
             return
         
-        # Search in multiple columns
-        title_matches = self.df[self.df['title'].str.contains(query, case=False, na=False)]
-        cast_matches = self.df[self.df['cast'].str.contains(query, case=False, na=False)]
-        director_matches = self.df[self.df['director'].str.contains(query, case=False, na=False)]
-        description_matches = self.df[self.df['description'].str.contains(query, case=False, na=False)]
+        # Search in multiple columns, one boolean mask per column
+        masks = [
+            self.df[col].str.contains(query, case=False, na=False, regex=False).to_numpy()
+            for col in ['title', 'cast', 'director', 'description']
+        ]
         
-        # Combine all matches
-        all_matches = pd.concat([title_matches, cast_matches, director_matches, description_matches]).drop_duplicates()
+        # Combine all matches, listing title matches first, then cast, etc.
+        first_match = np.select(masks, range(len(masks)), default=len(masks))
+        hits = np.flatnonzero(first_match < len(masks))
+        all_matches = self.df.iloc[hits[np.argsort(first_match[hits], kind='stable')]]
         
         if not all_matches.empty:
             print(f"\nFound {len(all_matches)} results for '{query}':")
@@ -607,10 +843,10 @@ if __name__ == "__main__":
     analyzer.keyword_analysis()
     
     # Run visualizations
-    analyzer.visualize_content_types()
-    analyzer.visualize_trends()
-    analyzer.visualize_duration()
-    analyzer.visualize_genres()
+    analyzer.visualize_content_types(save=True)
+    analyzer.visualize_trends(save=True)
+    analyzer.visualize_duration(save=True)
+    analyzer.visualize_genres(save=True)
 
     # Run interactive components
     analyzer.interactive_dashboard()